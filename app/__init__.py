@@ -0,0 +1,9 @@
+"""Code Review Mini-Agent application package."""
+
+import os
+import sys
+
+# Make the top-level modules (registry, tools, workflows) importable once for the whole package
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
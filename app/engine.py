@@ -1,91 +1,205 @@
 """Graph execution engine for workflow processing."""
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
+import operator
+import os
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from .models import GraphDefinition, ExecutionState, RunStatus, RunResult, LogEntry
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from registry import Node, NodeRegistry, node_registry
+from .models import GraphDefinition, ExecutionState, RunStatus, RunResult, RunStatusResponse, LogEntry, LogEntryDict
+from registry import Node, NodeRegistry, NodeResult, node_registry
+from workflows import get_tool as _get_registered_tool
+
+# State fields that change every iteration and are ignored when memoizing nodes
+_MEMO_EXCLUDED_FIELDS = {'iteration_count'}
+
+# Maximum number of memoized node results kept by the engine
+_MEMO_MAX_ENTRIES = 1024
+
+# Updates applied through ExecutionContext.update_state by the node running in
+# the current task; set while a pure node executes so its effects can be memoized
+_recorded_updates: ContextVar[Optional[Dict[str, Any]]] = ContextVar('_recorded_updates', default=None)
+
+# Log calls made through ExecutionContext.log by that same node, as
+# (node_id, level, message, args, data), so memoized results replay them too
+_recorded_logs: ContextVar[Optional[List[Tuple[str, str, str, Tuple[Any, ...], Optional[Dict[str, Any]]]]]] = (
+    ContextVar('_recorded_logs', default=None)
+)
+
+# Maximum number of workflow runs executing at the same time
+MAX_CONCURRENT_RUNS = int(os.getenv("MAX_CONCURRENT_RUNS", "32"))
+
+# Maximum number of log entries retained per run; older entries are dropped
+LOG_BUFFER_SIZE = 10_000
+
+# Declared ExecutionState fields; any other update key is stored in custom_data
+_STATE_FIELDS = frozenset(ExecutionState.model_fields)
+
+# Raw log record: (timestamp in epoch nanoseconds, node_id, level, message,
+# %-format arguments for message, data)
+LogRecord = Tuple[int, str, str, str, Tuple[Any, ...], Optional[Dict[str, Any]]]
+
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """Convert an epoch timestamp in nanoseconds to a local datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1_000_000_000)
+
+
+def _format_message(message: str, args: Tuple[Any, ...]) -> str:
+    """Apply deferred %-format arguments to a buffered log message."""
+    return message % args if args else message
 
 
 class ExecutionContext:
     """Manages state and logging during workflow execution."""
     
+    __slots__ = (
+        'run_id', 'state', '_owns_custom_data', 'logs', 'status',
+        'current_node', 'created_at', 'completed_at', 'error_message'
+    )
+    
     def __init__(self, run_id: str, initial_state: ExecutionState):
-        """Initialize execution context."""
+        """Initialize execution context.
+        
+        Contexts are only mutated from the event loop thread, and none of the
+        mutators below await, so no locking is needed around them.
+        """
         self.run_id = run_id
-        self.state = initial_state.copy(deep=True)
-        self.logs: List[LogEntry] = []
+        # Shallow copy; container fields are shared until replaced (see update_state)
+        self.state = initial_state.model_copy()
+        self._owns_custom_data = False
+        self.logs: Deque[LogRecord] = deque(maxlen=LOG_BUFFER_SIZE)
         self.status = RunStatus.PENDING
         self.current_node: Optional[str] = None
         self.created_at = datetime.now()
         self.completed_at: Optional[datetime] = None
         self.error_message: Optional[str] = None
-        self._lock = asyncio.Lock()
     
-    async def log(self, node_id: str, message: str, level: str = "INFO", data: Optional[Dict[str, Any]] = None):
-        """Add a log entry."""
-        async with self._lock:
-            entry = LogEntry(
-                timestamp=datetime.now(),
+    def log(self, node_id: str, message: str, level: str = "INFO", data: Optional[Dict[str, Any]] = None,
+            args: Tuple[Any, ...] = ()):
+        """Add a log entry.
+        
+        Entries are buffered as raw tuples with integer timestamps; datetimes,
+        LogEntry models and, when ``args`` is given, the ``message % args``
+        formatting are only done when logs are read.
+        """
+        self.logs.append((time.time_ns(), node_id, level, message, args, data))
+        
+        recorder = _recorded_logs.get()
+        if recorder is not None:
+            recorder.append((node_id, level, message, args, data))
+    
+    def get_logs(self) -> List[LogEntry]:
+        """Materialize buffered log records as LogEntry models."""
+        return [
+            LogEntry(
+                timestamp=_datetime_from_ns(timestamp_ns),
                 node_id=node_id,
                 level=level,
-                message=message,
+                message=_format_message(message, args),
                 data=data
             )
-            self.logs.append(entry)
+            for timestamp_ns, node_id, level, message, args, data in self.logs
+        ]
     
-    async def update_state(self, updates: Dict[str, Any]):
-        """Update execution state."""
-        async with self._lock:
+    def update_state(self, updates: Dict[str, Any]):
+        """Update execution state.
+        
+        The state is a shallow copy of the run's initial state, so nodes must
+        replace list and dict fields through this method rather than mutating
+        them in place.
+        """
+        state = self.state
+        if _STATE_FIELDS.issuperset(updates):
+            # Every key is a declared field: apply the whole batch in one step.
+            # ExecutionState does not validate on assignment, so this matches
+            # per-key setattr without pydantic's per-attribute overhead.
+            state.__dict__.update(updates)
+            state.__pydantic_fields_set__.update(updates)
+        else:
             for key, value in updates.items():
-                if hasattr(self.state, key):
-                    setattr(self.state, key, value)
+                if key in _STATE_FIELDS:
+                    setattr(state, key, value)
                 else:
-                    self.state.custom_data[key] = value
+                    if not self._owns_custom_data:
+                        # Copy-on-write: custom_data is shared until the first write
+                        state.custom_data = dict(state.custom_data)
+                        self._owns_custom_data = True
+                    state.custom_data[key] = value
+        
+        recorder = _recorded_updates.get()
+        if recorder is not None:
+            recorder.update(updates)
     
-    async def set_status(self, status: RunStatus, error_message: Optional[str] = None):
+    def set_status(self, status: RunStatus, error_message: Optional[str] = None):
         """Update run status."""
-        async with self._lock:
-            self.status = status
-            if error_message:
-                self.error_message = error_message
-            if status in [RunStatus.COMPLETED, RunStatus.ERROR, RunStatus.TIMEOUT]:
-                self.completed_at = datetime.now()
-    
-    async def set_current_node(self, node_id: Optional[str]):
+        self.status = status
+        if error_message:
+            self.error_message = error_message
+        if status in [RunStatus.COMPLETED, RunStatus.ERROR, RunStatus.TIMEOUT]:
+            self.completed_at = datetime.now()
+    
+    def set_current_node(self, node_id: Optional[str]):
         """Set the currently executing node."""
-        async with self._lock:
-            self.current_node = node_id
+        self.current_node = node_id
     
-    async def increment_iteration(self):
+    def increment_iteration(self):
         """Increment the iteration counter."""
-        async with self._lock:
-            self.state.iteration_count += 1
-    
-    def get_tool(self, tool_name: str):
-        """Get a tool function from the tool registry."""
-        # Import here to avoid circular imports
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from workflows import get_tool
-        return get_tool(tool_name)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert context to dictionary for serialization."""
+        self.state.iteration_count += 1
+    
+    # Get a tool function from the tool registry
+    get_tool = staticmethod(_get_registered_tool)
+    
+    def to_response(self) -> RunStatusResponse:
+        """Build the run status response directly from the live context."""
+        return RunStatusResponse(
+            run_id=self.run_id,
+            status=self.status,
+            current_node=self.current_node,
+            iteration_count=self.state.iteration_count,
+            state=self.state,
+            logs=self.get_logs(),
+            created_at=self.created_at,
+            completed_at=self.completed_at,
+            error_message=self.error_message
+        )
+    
+    def iter_log_dicts(self) -> Iterator[LogEntryDict]:
+        """Yield buffered log records as JSON-ready dictionaries, one at a time."""
+        for timestamp_ns, node_id, level, message, args, data in self.logs:
+            yield {
+                "timestamp": _datetime_from_ns(timestamp_ns).isoformat(),
+                "node_id": node_id,
+                "level": level,
+                "message": _format_message(message, args),
+                "data": data
+            }
+    
+    def to_dict(self, include_logs: bool = True) -> Dict[str, Any]:
+        """Convert context to dictionary for serialization.
+        
+        Args:
+            include_logs: Whether to materialize the log buffer; callers that
+                only need state and status can skip it entirely
+            
+        Returns:
+            JSON-ready dictionary describing the run
+        """
         return {
             "run_id": self.run_id,
             "status": self.status.value,
             "current_node": self.current_node,
             "iteration_count": self.state.iteration_count,
-            "state": self.state.dict(),
-            "logs": [log.dict() for log in self.logs],
+            "state": self.state.model_dump(),
+            "logs": list(self.iter_log_dicts()) if include_logs else [],
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "error_message": self.error_message
@@ -98,79 +212,97 @@ class ContextManager:
     def __init__(self):
         """Initialize context manager."""
         self._contexts: Dict[str, ExecutionContext] = {}
-        self._lock = asyncio.Lock()
     
     async def create_context(self, initial_state: ExecutionState) -> ExecutionContext:
         """Create a new execution context."""
-        run_id = str(uuid4())
+        run_id = uuid4().hex
         context = ExecutionContext(run_id, initial_state)
-        
-        async with self._lock:
-            self._contexts[run_id] = context
-        
+        self._contexts[run_id] = context
         return context
     
     async def get_context(self, run_id: str) -> Optional[ExecutionContext]:
         """Get execution context by run ID."""
-        async with self._lock:
-            return self._contexts.get(run_id)
+        return self._contexts.get(run_id)
+
+
+# Comparison operators supported in edge conditions
+_CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+def _always_traverse(context: 'ExecutionContext') -> bool:
+    """Predicate for edges without an effective condition."""
+    return True
 
 
 class Edge:
     """Represents a connection between nodes."""
     
+    __slots__ = ('from_node', 'to_node', 'condition', '_predicate', 'always_true')
+    
     def __init__(self, from_node: str, to_node: str, condition: Optional[str] = None):
-        """Initialize edge."""
+        """Initialize edge and compile its condition."""
         self.from_node = from_node
         self.to_node = to_node
         self.condition = condition
+        self._predicate = self._compile_condition(condition)
+        # True when the condition is absent or unparseable, letting callers skip the predicate call
+        self.always_true = self._predicate is _always_traverse
     
-    def should_traverse(self, context: ExecutionContext) -> bool:
-        """Check if this edge should be traversed."""
-        if not self.condition:
-            return True
+    @staticmethod
+    def _compile_condition(condition: Optional[str]) -> Callable[[ExecutionContext], bool]:
+        """Parse a condition string once into a predicate over the execution context.
+        
+        Conditions have the form ``state.<field> <operator> <value>``. Anything that
+        cannot be parsed compiles to a predicate that always traverses.
+        """
+        if not condition:
+            return _always_traverse
+        
+        condition = condition.strip()
+        if not condition.startswith('state.'):
+            return _always_traverse
         
+        parts = condition.split(' ', 2)
+        if len(parts) < 3:
+            return _always_traverse
+        
+        field_path, operator_symbol, value_str = parts
+        compare = _CONDITION_OPERATORS.get(operator_symbol)
+        if compare is None:
+            return _always_traverse
+        
+        field_name = field_path.replace('state.', '')
         try:
-            # Simple condition evaluation
-            condition = self.condition.strip()
-            
-            if condition.startswith('state.'):
-                parts = condition.split(' ', 2)
-                if len(parts) >= 3:
-                    field_path = parts[0]
-                    operator = parts[1]
-                    value_str = parts[2]
-                    
-                    field_name = field_path.replace('state.', '')
-                    if hasattr(context.state, field_name):
-                        field_value = getattr(context.state, field_name)
-                    else:
-                        field_value = context.state.custom_data.get(field_name)
-                    
-                    try:
-                        if '.' in value_str:
-                            target_value = float(value_str)
-                        else:
-                            target_value = int(value_str)
-                    except ValueError:
-                        target_value = value_str.strip('"\'')
-                    
-                    if operator == '>=':
-                        return field_value >= target_value
-                    elif operator == '<=':
-                        return field_value <= target_value
-                    elif operator == '>':
-                        return field_value > target_value
-                    elif operator == '<':
-                        return field_value < target_value
-                    elif operator == '==':
-                        return field_value == target_value
-                    elif operator == '!=':
-                        return field_value != target_value
-            
-            return True
-        except Exception:
-            return True
+            if '.' in value_str:
+                target_value = float(value_str)
+            else:
+                target_value = int(value_str)
+        except ValueError:
+            target_value = value_str.strip('"\'')
+        
+        def predicate(context: ExecutionContext) -> bool:
+            state = context.state
+            if hasattr(state, field_name):
+                field_value = getattr(state, field_name)
+            else:
+                field_value = state.custom_data.get(field_name)
+            try:
+                return compare(field_value, target_value)
+            except Exception:
+                return True
+        
+        return predicate
+    
+    def should_traverse(self, context: ExecutionContext) -> bool:
+        """Check if this edge should be traversed."""
+        return self.always_true or self._predicate(context)
 
 
 # Global context manager instance
@@ -180,6 +312,8 @@ context_manager = ContextManager()
 class Graph:
     """Represents a workflow graph."""
     
+    __slots__ = ('graph_id', 'definition', 'nodes', 'edges', '_outgoing', 'topo_levels')
+    
     def __init__(self, graph_id: str, definition: GraphDefinition):
         """Initialize graph.
         
@@ -191,6 +325,8 @@ class Graph:
         self.definition = definition
         self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
+        self._outgoing: Dict[str, List[Edge]] = defaultdict(list)
+        self.topo_levels: Optional[List[List[str]]] = None
         self._build_graph()
     
     def _build_graph(self):
@@ -204,6 +340,60 @@ class Graph:
         for edge_def in self.definition.edges:
             edge = Edge(edge_def.from_node, edge_def.to_node, edge_def.condition)
             self.edges.append(edge)
+            self._outgoing[edge.from_node].append(edge)
+        
+        # Precompute execution levels when the traversal order is static
+        self.topo_levels = self._compute_topo_levels()
+    
+    def _compute_topo_levels(self) -> Optional[List[List[str]]]:
+        """Group nodes reachable from the start node into topological levels.
+        
+        Each level only contains nodes whose predecessors are all in earlier
+        levels. Levels are ordered as the nodes appear in the definition.
+        
+        Returns:
+            List of levels, or None if the reachable subgraph contains a cycle or
+            a conditional edge and execution order must be discovered at run time
+        """
+        start_node = self.definition.start_node
+        
+        # Collect reachable nodes, bailing out on conditional edges
+        reachable = {start_node}
+        stack = [start_node]
+        while stack:
+            node_id = stack.pop()
+            for edge in self._outgoing.get(node_id, ()):
+                if not edge.always_true:
+                    return None
+                if edge.to_node not in reachable:
+                    reachable.add(edge.to_node)
+                    stack.append(edge.to_node)
+        
+        # Kahn's algorithm over the reachable subgraph
+        in_degree = dict.fromkeys(reachable, 0)
+        for node_id in reachable:
+            for edge in self._outgoing.get(node_id, ()):
+                in_degree[edge.to_node] += 1
+        
+        position = {node_id: index for index, node_id in enumerate(self.definition.nodes)}
+        levels = []
+        level = [node_id for node_id in reachable if in_degree[node_id] == 0]
+        placed = 0
+        while level:
+            level.sort(key=lambda node_id: position.get(node_id, len(position)))
+            levels.append(level)
+            placed += len(level)
+            next_level = []
+            for node_id in level:
+                for edge in self._outgoing.get(node_id, ()):
+                    in_degree[edge.to_node] -= 1
+                    if in_degree[edge.to_node] == 0:
+                        next_level.append(edge.to_node)
+            level = next_level
+        
+        if placed != len(reachable):
+            return None
+        return levels
     
     def get_next_nodes(self, current_node: str, context: ExecutionContext) -> List[str]:
         """Get next nodes to execute based on edges and conditions.
@@ -216,8 +406,8 @@ class Graph:
             List of next node IDs
         """
         next_nodes = []
-        for edge in self.edges:
-            if edge.from_node == current_node and edge.should_traverse(context):
+        for edge in self._outgoing.get(current_node, ()):
+            if edge.always_true or edge._predicate(context):
                 next_nodes.append(edge.to_node)
         return next_nodes
     
@@ -240,32 +430,69 @@ class Graph:
             if edge_def.to_node not in self.definition.nodes:
                 errors.append(f"Edge to_node '{edge_def.to_node}' not found in nodes")
         
-        # Check for cycles (simple detection)
-        visited = set()
-        rec_stack = set()
+        # Cycles are not rejected: loops are allowed, and execution runs each
+        # node at most once per run (see cycles() for diagnostics)
         
-        def has_cycle(node_id: str) -> bool:
-            if node_id in rec_stack:
-                return True
-            if node_id in visited:
-                return False
-            
-            visited.add(node_id)
-            rec_stack.add(node_id)
+        return errors
+    
+    def cycles(self) -> List[List[str]]:
+        """Find all cycles in the graph as strongly connected components.
+        
+        Uses an iterative version of Tarjan's algorithm, so it runs in O(V + E)
+        without Python recursion.
+        
+        Returns:
+            List of non-trivial strongly connected components (more than one node,
+            or a single node with a self-loop), each listed in discovery order
+        """
+        def successors(node_id: str) -> Iterator[str]:
+            return (edge.to_node for edge in self._outgoing.get(node_id, ()))
+        
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        
+        for root in self.definition.nodes:
+            if root in index:
+                continue
             
-            # Get all outgoing edges
-            for edge in self.edges:
-                if edge.from_node == node_id:
-                    if has_cycle(edge.to_node):
-                        return True
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, successors(root))]
             
-            rec_stack.remove(node_id)
-            return False
-        
-        # Only check for cycles if we don't have loop control
-        # (loops are allowed with proper termination conditions)
+            while work:
+                node_id, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, successors(child)))
+                        break
+                    if child in on_stack:
+                        lowlink[node_id] = min(lowlink[node_id], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node_id])
+                    
+                    if lowlink[node_id] == index[node_id]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node_id:
+                                break
+                        component.reverse()
+                        if len(component) > 1 or node_id in successors(node_id):
+                            components.append(component)
         
-        return errors
+        return components
 
 
 class GraphEngine:
@@ -274,12 +501,22 @@ class GraphEngine:
     def __init__(self):
         """Initialize graph engine."""
         self._graphs: Dict[str, Graph] = {}
-        self._lock = asyncio.Lock()
+        # Definition content hash -> graph ID, so identical definitions share one Graph
+        self._by_hash: Dict[str, str] = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+        # Strong references to background runs so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
         self.logger = logging.getLogger(__name__)
+        # (graph_id, node_id, state fingerprint) -> (result, state updates, log calls)
+        # for pure nodes
+        self._memo: 'OrderedDict[Tuple[str, str, str], Tuple[NodeResult, Dict[str, Any], List[Tuple]]]' = OrderedDict()
     
     async def create_graph(self, definition: GraphDefinition) -> str:
         """Create a new graph from definition.
         
+        Definitions are immutable, so submitting an identical definition again
+        returns the ID of the graph that was already created for it.
+        
         Args:
             definition: Graph definition
             
@@ -289,8 +526,14 @@ class GraphEngine:
         Raises:
             ValueError: If graph definition is invalid
         """
+        payload = json.dumps(definition.model_dump(), sort_keys=True, default=str).encode()
+        definition_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        existing_id = self._by_hash.get(definition_hash)
+        if existing_id is not None:
+            return existing_id
+        
         # Generate unique graph ID
-        graph_id = str(uuid4())
+        graph_id = uuid4().hex
         
         # Create and validate graph
         graph = Graph(graph_id, definition)
@@ -299,8 +542,8 @@ class GraphEngine:
             raise ValueError(f"Graph validation failed: {'; '.join(errors)}")
         
         # Store graph
-        async with self._lock:
-            self._graphs[graph_id] = graph
+        self._graphs[graph_id] = graph
+        self._by_hash[definition_hash] = graph_id
         
         self.logger.info(f"Created graph {graph_id} with {len(definition.nodes)} nodes")
         return graph_id
@@ -314,8 +557,7 @@ class GraphEngine:
         Returns:
             Graph instance or None if not found
         """
-        async with self._lock:
-            return self._graphs.get(graph_id)
+        return self._graphs.get(graph_id)
     
     async def execute_graph(self, graph_id: str, initial_state: ExecutionState, 
                           sync: bool = False) -> RunResult:
@@ -338,32 +580,44 @@ class GraphEngine:
         
         # Create execution context
         context = await context_manager.create_context(initial_state)
-        await context.set_status(RunStatus.RUNNING)
+        context.set_status(RunStatus.RUNNING)
         
         if sync:
             # Run synchronously with timeout
             try:
                 await asyncio.wait_for(
-                    self._execute_workflow(graph, context),
+                    self._run_workflow(graph, context),
                     timeout=30.0  # 30 second timeout for sync execution
                 )
             except asyncio.TimeoutError:
-                await context.set_status(RunStatus.TIMEOUT, "Synchronous execution timed out")
+                context.set_status(RunStatus.TIMEOUT, "Synchronous execution timed out")
         else:
             # Run asynchronously
-            asyncio.create_task(self._execute_workflow(graph, context))
+            task = asyncio.create_task(self._run_workflow(graph, context))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
         
         # Return result
         return RunResult(
             run_id=context.run_id,
             status=context.status,
             final_state=context.state if sync and context.status == RunStatus.COMPLETED else None,
-            logs=context.logs if sync else [],
+            logs=context.get_logs() if sync else [],
             created_at=context.created_at,
             completed_at=context.completed_at,
             error_message=context.error_message
         )
     
+    async def _run_workflow(self, graph: Graph, context: ExecutionContext):
+        """Execute a workflow once a concurrency slot is available.
+        
+        Args:
+            graph: Graph to execute
+            context: Execution context
+        """
+        async with self._semaphore:
+            await self._execute_workflow(graph, context)
+    
     async def _execute_workflow(self, graph: Graph, context: ExecutionContext):
         """Execute workflow logic.
         
@@ -372,35 +626,45 @@ class GraphEngine:
             context: Execution context
         """
         try:
-            await context.log("engine", f"Starting workflow execution for graph {graph.graph_id}")
+            context.log("engine", "Starting workflow execution for graph %s", args=(graph.graph_id,))
             
-            # Start with the start node
+            # Static graphs run level by level; others are traversed dynamically
+            levels = graph.topo_levels
+            level_index = 0
+            
+            # Start with the start node. Each node runs at most once per run, which
+            # is what bounds traversal of graphs that contain cycles.
             current_nodes = [graph.definition.start_node]
-            executed_nodes = set()
+            executed_nodes: Set[str] = set()
             
             while current_nodes and context.state.iteration_count < context.state.max_iterations:
-                await context.increment_iteration()
-                await context.log("engine", f"Starting iteration {context.state.iteration_count}")
+                context.increment_iteration()
+                context.log("engine", "Starting iteration %d", args=(context.state.iteration_count,))
                 
                 next_nodes = []
+                follow_levels = levels is not None
+                level_done = []
                 
-                for node_id in current_nodes:
-                    if node_id in executed_nodes:
-                        continue  # Skip already executed nodes in this iteration
-                    
-                    node = graph.nodes.get(node_id)
-                    if not node:
-                        await context.log("engine", f"Node {node_id} not found", "ERROR")
-                        continue
-                    
-                    await context.set_current_node(node_id)
-                    await context.log(node_id, f"Executing node {node_id}")
+                # Sibling nodes in the frontier are independent, so run them concurrently.
+                # A node awaiting inside execute could then see a sibling's writes
+                # that its memo key does not cover, so only lone nodes are memoized.
+                memoize = len(current_nodes) == 1
+                outcomes = await asyncio.gather(
+                    *(self._run_node(graph, node_id, context, memoize) for node_id in current_nodes),
+                    return_exceptions=True
+                )
+                
+                for node_id, outcome in zip(current_nodes, outcomes):
+                    if isinstance(outcome, BaseException):
+                        context.set_status(RunStatus.ERROR, f"Node {node_id} failed with exception: {str(outcome)}")
+                        return
                     
-                    # Execute node
-                    result = await node.execute_with_timeout(context)
+                    result = outcome
+                    if result is None:
+                        continue  # Node not found
                     
                     if not result.success:
-                        await context.set_status(RunStatus.ERROR, result.error_message)
+                        context.set_status(RunStatus.ERROR, result.error_message)
                         return
                     
                     executed_nodes.add(node_id)
@@ -408,49 +672,154 @@ class GraphEngine:
                     # Get next nodes
                     if result.next_nodes:
                         next_nodes.extend(result.next_nodes)
-                    else:
+                        follow_levels = False
+                    elif levels is None:
                         next_nodes.extend(graph.get_next_nodes(node_id, context))
+                    else:
+                        level_done.append(node_id)
                 
                 # Check termination conditions
                 if context.state.quality_score >= context.state.quality_threshold:
-                    await context.log("engine", 
-                        f"Quality threshold reached: {context.state.quality_score} >= {context.state.quality_threshold}")
+                    context.log("engine", "Quality threshold reached: %s >= %s",
+                        args=(context.state.quality_score, context.state.quality_threshold))
                     break
                 
-                # Remove duplicates and continue
-                current_nodes = list(set(next_nodes))
+                if follow_levels:
+                    level_index += 1
+                    current_nodes = levels[level_index] if level_index < len(levels) else []
+                else:
+                    if levels is not None:
+                        # A node chose its own successors, so traverse dynamically from here.
+                        # Static graphs have no conditional edges, so deferring these
+                        # lookups until the end of the iteration does not change them.
+                        for node_id in level_done:
+                            next_nodes.extend(graph.get_next_nodes(node_id, context))
+                        levels = None
+                    
+                    # Remove duplicates and already executed nodes, then continue
+                    current_nodes = list(set(next_nodes) - executed_nodes)
                 
                 if not current_nodes:
-                    await context.log("engine", "No more nodes to execute")
+                    context.log("engine", "No more nodes to execute")
                     break
             
             if context.state.iteration_count >= context.state.max_iterations:
-                await context.log("engine", 
-                    f"Maximum iterations reached: {context.state.max_iterations}", "WARNING")
+                context.log("engine", "Maximum iterations reached: %s", "WARNING",
+                    args=(context.state.max_iterations,))
             
-            await context.set_current_node(None)
-            await context.set_status(RunStatus.COMPLETED)
-            await context.log("engine", "Workflow execution completed successfully")
+            context.set_current_node(None)
+            context.set_status(RunStatus.COMPLETED)
+            context.log("engine", "Workflow execution completed successfully")
             
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
-            await context.set_status(RunStatus.ERROR, error_msg)
-            await context.log("engine", error_msg, "ERROR")
+            context.set_status(RunStatus.ERROR, error_msg)
+            context.log("engine", error_msg, "ERROR")
+    
+    async def _run_node(self, graph: Graph, node_id: str, context: ExecutionContext,
+                        memoize: bool = True) -> Optional[NodeResult]:
+        """Execute one node of the current frontier.
+        
+        Args:
+            graph: Graph being executed
+            node_id: ID of the node to execute
+            context: Execution context
+            memoize: Whether a pure node may use the memo
+            
+        Returns:
+            Node result, or None if the node does not exist
+        """
+        node = graph.nodes.get(node_id)
+        if not node:
+            context.log("engine", "Node %s not found", "ERROR", args=(node_id,))
+            return None
+        
+        # With several nodes in flight this reports the most recently started one
+        context.set_current_node(node_id)
+        context.log(node_id, "Executing node %s", args=(node_id,))
+        
+        return await self._execute_node(graph, node, context, memoize)
+    
+    @staticmethod
+    def _state_fingerprint(state_data: Dict[str, Any]) -> str:
+        """Compute a stable hash of the state inputs relevant to node execution.
+        
+        Args:
+            state_data: Serialized execution state
+            
+        Returns:
+            Hex digest of the state
+        """
+        relevant = {key: value for key, value in state_data.items() if key not in _MEMO_EXCLUDED_FIELDS}
+        payload = json.dumps(relevant, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    async def _execute_node(self, graph: Graph, node: Node, context: ExecutionContext,
+                            memoize: bool = True) -> NodeResult:
+        """Execute a node, reusing a memoized result for pure nodes.
+        
+        Pure nodes are deterministic functions of the execution state and report
+        their effects through ``context.update_state`` and ``context.log``, so a
+        node that already ran against an identical state can replay its updates
+        and log lines instead of executing again.
+        
+        Args:
+            graph: Graph the node belongs to
+            node: Node to execute
+            context: Execution context
+            memoize: Whether a pure node may use the memo. Callers pass False
+                while sibling nodes run concurrently, since the node could then
+                read state a sibling writes after the key was computed.
+            
+        Returns:
+            Node result
+        """
+        if not (node.pure and memoize):
+            return await node.execute_with_timeout(context)
+        
+        key = (graph.graph_id, node.node_id, self._state_fingerprint(context.state.model_dump()))
+        
+        cached = self._memo.get(key)
+        if cached is not None:
+            self._memo.move_to_end(key)
+            result, updates, logs = cached
+            for node_id, level, message, args, data in copy.deepcopy(logs):
+                context.log(node_id, message, level, data, args)
+            context.update_state(copy.deepcopy(updates))
+            return result
+        
+        # Record the node's own updates and log calls
+        updates_token = _recorded_updates.set({})
+        logs_token = _recorded_logs.set([])
+        try:
+            result = await node.execute_with_timeout(context)
+            updates = _recorded_updates.get()
+            logs = _recorded_logs.get()
+        finally:
+            _recorded_logs.reset(logs_token)
+            _recorded_updates.reset(updates_token)
+        
+        if result.success:
+            self._memo[key] = (result, copy.deepcopy(updates), copy.deepcopy(logs))
+            if len(self._memo) > _MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+        
+        return result
     
-    async def get_run_status(self, run_id: str) -> Optional[Dict]:
+    async def get_run_status(self, run_id: str) -> Optional[RunStatusResponse]:
         """Get run status by run ID.
         
         Args:
             run_id: Run identifier
             
         Returns:
-            Run status dictionary or None if not found
+            Run status response or None if not found
         """
         context = await context_manager.get_context(run_id)
         if not context:
             return None
         
-        return context.to_dict()
+        return context.to_response()
     
     async def list_graphs(self) -> List[str]:
         """List all graph IDs.
@@ -458,8 +827,7 @@ class GraphEngine:
         Returns:
             List of graph IDs
         """
-        async with self._lock:
-            return list(self._graphs.keys())
+        return list(self._graphs.keys())
 
 
 # Global graph engine instance
@@ -4,8 +4,8 @@ import logging
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .engine import graph_engine
 from .models import (
@@ -13,10 +13,7 @@ from .models import (
     RunStatusResponse, ErrorResponse, ExecutionState, RunStatus
 )
 from .storage import graph_store, run_store
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from workflows import register_code_review_nodes
+from workflows import register_code_review_nodes, list_tools as list_registered_tools
 
 
 # Configure logging
@@ -48,7 +45,8 @@ app = FastAPI(
     title="Code Review Mini-Agent",
     description="A graph-based workflow engine for automated code review",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -61,7 +59,7 @@ async def global_exception_handler(request, exc):
         content=ErrorResponse(
             error="internal_server_error",
             message="An internal server error occurred"
-        ).dict()
+        ).model_dump()
     )
 
 
@@ -116,7 +114,7 @@ async def create_graph(request: GraphCreateRequest):
             detail=ErrorResponse(
                 error="validation_error",
                 message=str(e)
-            ).dict()
+            ).model_dump()
         )
     except Exception as e:
         logger.error(f"Failed to create graph: {str(e)}")
@@ -125,7 +123,7 @@ async def create_graph(request: GraphCreateRequest):
             detail=ErrorResponse(
                 error="creation_failed",
                 message="Failed to create graph"
-            ).dict()
+            ).model_dump()
         )
 
 
@@ -154,7 +152,7 @@ async def run_graph(request: RunRequest, sync: bool = Query(False, description="
                 detail=ErrorResponse(
                     error="graph_not_found",
                     message=f"Graph {request.graph_id} not found"
-                ).dict()
+                ).model_dump()
             )
         
         # Execute graph
@@ -177,7 +175,7 @@ async def run_graph(request: RunRequest, sync: bool = Query(False, description="
             detail=ErrorResponse(
                 error="execution_failed",
                 message="Failed to start graph execution"
-            ).dict()
+            ).model_dump()
         )
 
 
@@ -198,44 +196,19 @@ async def get_run_status(run_id: str):
         logger.debug(f"Getting status for run {run_id}")
         
         # Get run status from engine
-        status_data = await graph_engine.get_run_status(run_id)
-        if not status_data:
+        response = await graph_engine.get_run_status(run_id)
+        if not response:
             raise HTTPException(
                 status_code=404,
                 detail=ErrorResponse(
                     error="run_not_found",
                     message=f"Run {run_id} not found"
-                ).dict()
+                ).model_dump()
             )
         
-        # Convert to response model
-        from datetime import datetime
-        
-        response = RunStatusResponse(
-            run_id=status_data['run_id'],
-            status=RunStatus(status_data['status']),
-            current_node=status_data.get('current_node'),
-            iteration_count=status_data.get('iteration_count', 0),
-            state=ExecutionState(**status_data['state']),
-            logs=[],  # Logs are included in the status_data but we'll parse them
-            created_at=datetime.fromisoformat(status_data['created_at']),
-            completed_at=datetime.fromisoformat(status_data['completed_at']) if status_data.get('completed_at') else None,
-            error_message=status_data.get('error_message')
-        )
-        
-        # Parse logs
-        for log_data in status_data.get('logs', []):
-            from .models import LogEntry
-            log_entry = LogEntry(
-                timestamp=datetime.fromisoformat(log_data['timestamp']),
-                node_id=log_data['node_id'],
-                level=log_data['level'],
-                message=log_data['message'],
-                data=log_data.get('data')
-            )
-            response.logs.append(log_entry)
-        
-        return response
+        # Serialize once in pydantic-core; returning a Response directly skips
+        # FastAPI's revalidation of the response model
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         raise
@@ -246,7 +219,7 @@ async def get_run_status(run_id: str):
             detail=ErrorResponse(
                 error="status_retrieval_failed",
                 message="Failed to retrieve run status"
-            ).dict()
+            ).model_dump()
         )
 
 
@@ -275,7 +248,7 @@ async def list_graphs():
             detail=ErrorResponse(
                 error="listing_failed",
                 message="Failed to list graphs"
-            ).dict()
+            ).model_dump()
         )
 
 
@@ -283,8 +256,7 @@ async def list_graphs():
 async def list_tools():
     """List all available tools in the tool registry."""
     try:
-        from workflows import list_tools
-        tools = list_tools()
+        tools = list_registered_tools()
         
         # Enhanced tool information
         tool_categories = {
@@ -308,7 +280,7 @@ async def list_tools():
             detail=ErrorResponse(
                 error="listing_failed",
                 message="Failed to list tools"
-            ).dict()
+            ).model_dump()
         )
 
 
@@ -320,4 +292,5 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
     
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    # uvicorn[standard] picks uvloop and httptools automatically where available
+    uvicorn.run(app, host=host, port=port, loop="auto", http="auto")
\ No newline at end of file
@@ -1,9 +1,9 @@
 """Pydantic models for API requests and responses."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, TypedDict, Union
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, ValidationInfo, field_validator
 
 
 class NodeType(str, Enum):
@@ -37,6 +37,7 @@ class IssueType(str, Enum):
     NAMING = "naming"
     STRUCTURE = "structure"
     STYLE = "style"
+    MAINTENANCE = "maintenance"
 
 
 class EdgeDefinition(BaseModel):
@@ -50,7 +51,9 @@ class NodeDefinition(BaseModel):
     """Definition of a workflow node."""
     id: str = Field(..., description="Unique node identifier")
     type: NodeType = Field(..., description="Type of node")
-    config: Dict[str, Any] = Field(default_factory=dict, description="Node configuration")
+    # Must be a dict, but its values are opaque to the API; nodes read their own
+    # keys, so the values are not walked
+    config: Dict[str, SkipValidation[Any]] = Field(default_factory=dict, description="Node configuration")
 
 
 class GraphDefinition(BaseModel):
@@ -60,10 +63,11 @@ class GraphDefinition(BaseModel):
     start_node: str = Field(..., description="ID of the starting node")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Graph metadata")
 
-    @validator('start_node')
-    def validate_start_node(cls, v, values):
+    @field_validator('start_node')
+    @classmethod
+    def validate_start_node(cls, v: str, info: ValidationInfo) -> str:
         """Validate that start_node exists in nodes."""
-        if 'nodes' in values and v not in values['nodes']:
+        if 'nodes' in info.data and v not in info.data['nodes']:
             raise ValueError(f"Start node '{v}' not found in nodes")
         return v
 
@@ -79,6 +83,8 @@ class CodeIssue(BaseModel):
 
 class ExecutionState(BaseModel):
     """State maintained during workflow execution."""
+    model_config = ConfigDict(extra='ignore')
+    
     # Input data
     source_code: str = Field(default="", description="Source code being analyzed")
     
@@ -86,6 +92,13 @@ class ExecutionState(BaseModel):
     lines_of_code: int = Field(default=0, description="Number of lines of code")
     nested_blocks: int = Field(default=0, description="Number of nested blocks")
     long_names: List[str] = Field(default_factory=list, description="List of long variable/function names")
+    functions_found: int = Field(default=0, description="Number of functions defined")
+    classes_found: int = Field(default=0, description="Number of classes defined")
+    cyclomatic_complexity: int = Field(default=0, description="Cyclomatic complexity of the code")
+    todo_comments: List[Dict[str, Any]] = Field(default_factory=list, description="TODO/FIXME comments found")
+    print_statements: List[Dict[str, Any]] = Field(default_factory=list, description="Print statement calls found")
+    bare_exceptions: List[Dict[str, Any]] = Field(default_factory=list, description="Bare except clauses found")
+    long_lines: List[Dict[str, Any]] = Field(default_factory=list, description="Lines longer than the style limit")
     
     # Calculated scores
     complexity_score: float = Field(default=0.0, description="Complexity score (0-100)")
@@ -110,7 +123,16 @@ class LogEntry(BaseModel):
     node_id: str = Field(..., description="ID of the node that generated this log")
     level: str = Field(default="INFO", description="Log level (INFO, WARNING, ERROR)")
     message: str = Field(..., description="Log message")
-    data: Optional[Dict[str, Any]] = Field(default=None, description="Additional log data")
+    data: Annotated[Optional[Dict[str, Any]], SkipValidation] = Field(default=None, description="Additional log data")
+
+
+class LogEntryDict(TypedDict, total=False):
+    """Unvalidated log entry used for internal storage; LogEntry is the wire schema."""
+    timestamp: str
+    node_id: str
+    level: str
+    message: str
+    data: Optional[Dict[str, Any]]
 
 
 class RunRequest(BaseModel):
@@ -1,20 +1,75 @@
 """In-memory storage for graphs and execution runs."""
 
-import asyncio
+import time
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 
-from .models import GraphDefinition, ExecutionState, RunStatus
+from .models import GraphDefinition, ExecutionState, LogEntryDict, RunStatus
+
+
+# Default number of log entries retained per run; older entries are dropped
+RUN_LOG_BUFFER_SIZE = 1000
+
+# Status values after which a run no longer changes
+_TERMINAL_STATUSES = frozenset({RunStatus.COMPLETED.value, RunStatus.ERROR.value, RunStatus.TIMEOUT.value})
+
+# Most recent (epoch seconds, ISO string) pair produced by _iso_now
+_last_iso: Tuple[float, str] = (0.0, "")
+
+
+def _iso_now(now: Optional[float] = None) -> str:
+    """Format a timestamp as a local ISO 8601 string.
+    
+    Bursts of records created within the same millisecond reuse the previous
+    formatted string instead of formatting it again.
+    
+    Args:
+        now: Epoch seconds to format; defaults to the current time
+        
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _last_iso
+    if now is None:
+        now = time.time()
+    
+    cached_at, formatted = _last_iso
+    if 0.0 <= now - cached_at < 0.001:
+        return formatted
+    
+    formatted = datetime.fromtimestamp(now).isoformat()
+    _last_iso = (now, formatted)
+    return formatted
+
+
+def _completed_at_ts(completed_at: Any) -> Optional[float]:
+    """Convert a completed_at value to epoch seconds.
+    
+    Args:
+        completed_at: ISO 8601 string, datetime or None
+        
+    Returns:
+        Epoch seconds, or None if completed_at is None
+    """
+    if completed_at is None:
+        return None
+    if isinstance(completed_at, str):
+        completed_at = datetime.fromisoformat(completed_at)
+    return completed_at.timestamp()
 
 
 class GraphStore:
     """In-memory storage for graph definitions."""
     
     def __init__(self):
-        """Initialize graph store."""
+        """Initialize graph store.
+        
+        The store is only used from the event loop thread and no method awaits
+        while touching the dictionary, so no locking is needed.
+        """
         self._graphs: Dict[str, Dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
     
     async def create_graph(self, definition: GraphDefinition) -> str:
         """Store a graph definition and return unique ID.
@@ -25,15 +80,21 @@ class GraphStore:
         Returns:
             Unique graph ID
         """
-        graph_id = str(uuid4())
+        graph_id = uuid4().hex
+        
+        # Outgoing (to_node, condition) pairs per node, built once so readers
+        # do not scan the edge list on every hop
+        adjacency: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+        for edge in definition.edges:
+            adjacency.setdefault(edge.from_node, []).append((edge.to_node, edge.condition))
         
-        async with self._lock:
-            self._graphs[graph_id] = {
-                'id': graph_id,
-                'definition': definition.dict(),
-                'created_at': datetime.now().isoformat(),
-                'metadata': definition.metadata or {}
-            }
+        self._graphs[graph_id] = {
+            'id': graph_id,
+            'definition': definition,
+            'adjacency': adjacency,
+            'created_at': _iso_now(),
+            'metadata': definition.metadata or {}
+        }
         
         return graph_id
     
@@ -46,8 +107,7 @@ class GraphStore:
         Returns:
             Graph data or None if not found
         """
-        async with self._lock:
-            return self._graphs.get(graph_id)
+        return self._graphs.get(graph_id)
     
     async def list_graphs(self) -> List[Dict[str, Any]]:
         """List all stored graphs.
@@ -55,8 +115,7 @@ class GraphStore:
         Returns:
             List of graph data
         """
-        async with self._lock:
-            return list(self._graphs.values())
+        return list(self._graphs.values())
     
     async def delete_graph(self, graph_id: str) -> bool:
         """Delete a graph.
@@ -67,8 +126,7 @@ class GraphStore:
         Returns:
             True if graph was deleted, False if not found
         """
-        async with self._lock:
-            return self._graphs.pop(graph_id, None) is not None
+        return self._graphs.pop(graph_id, None) is not None
     
     async def graph_exists(self, graph_id: str) -> bool:
         """Check if graph exists.
@@ -79,17 +137,26 @@ class GraphStore:
         Returns:
             True if graph exists
         """
-        async with self._lock:
-            return graph_id in self._graphs
+        return graph_id in self._graphs
 
 
 class RunStore:
     """In-memory storage for execution runs."""
     
-    def __init__(self):
-        """Initialize run store."""
+    def __init__(self, max_logs: int = RUN_LOG_BUFFER_SIZE):
+        """Initialize run store.
+        
+        As with GraphStore, every method completes its dictionary operations
+        without awaiting, so read-modify-write updates cannot interleave.
+        
+        Args:
+            max_logs: Maximum number of log entries kept per run
+        """
+        self._max_logs = max_logs
         self._runs: Dict[str, Dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        # Secondary index of graph ID -> run IDs for filtered listings; dict
+        # keys keep the runs in creation order
+        self._by_graph: Dict[str, Dict[str, None]] = defaultdict(dict)
     
     async def create_run(self, graph_id: str, initial_state: ExecutionState) -> str:
         """Create a new run record.
@@ -101,25 +168,50 @@ class RunStore:
         Returns:
             Unique run ID
         """
-        run_id = str(uuid4())
-        
-        async with self._lock:
-            self._runs[run_id] = {
-                'run_id': run_id,
-                'graph_id': graph_id,
-                'status': RunStatus.PENDING.value,
-                'initial_state': initial_state.dict(),
-                'current_state': initial_state.dict(),
-                'current_node': None,
-                'iteration_count': 0,
-                'logs': [],
-                'created_at': datetime.now().isoformat(),
-                'completed_at': None,
-                'error_message': None
-            }
+        run_id = uuid4().hex
+        
+        self._runs[run_id] = {
+            'run_id': run_id,
+            'graph_id': graph_id,
+            'status': RunStatus.PENDING.value,
+            # Live model instances; current_state starts as a deep copy so the
+            # initial snapshot survives in-place changes to the running state.
+            # model_copy skips the validation a constructor round-trip would do.
+            'initial_state': initial_state,
+            'current_state': initial_state.model_copy(deep=True),
+            'current_node': None,
+            'iteration_count': 0,
+            'logs': deque(maxlen=self._max_logs),
+            'created_at': _iso_now(),
+            'completed_at': None,
+            # Epoch seconds matching completed_at, used for age comparisons
+            'completed_at_ts': None,
+            'error_message': None
+        }
+        self._by_graph[graph_id][run_id] = None
         
         return run_id
     
+    def _remove_run(self, run_id: str) -> bool:
+        """Remove a run and its graph index entry.
+        
+        Args:
+            run_id: Run identifier
+            
+        Returns:
+            True if run was removed, False if not found
+        """
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return False
+        
+        run_ids = self._by_graph.get(run['graph_id'])
+        if run_ids is not None:
+            run_ids.pop(run_id, None)
+            if not run_ids:
+                del self._by_graph[run['graph_id']]
+        return True
+    
     async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve run by ID.
         
@@ -129,12 +221,14 @@ class RunStore:
         Returns:
             Run data or None if not found
         """
-        async with self._lock:
-            return self._runs.get(run_id)
+        return self._runs.get(run_id)
     
     async def update_run(self, run_id: str, updates: Dict[str, Any]) -> bool:
         """Update run data.
         
+        Setting completed_at here also refreshes completed_at_ts, so runs
+        finished without update_run_status are still found by cleanup.
+        
         Args:
             run_id: Run identifier
             updates: Dictionary of updates to apply
@@ -142,12 +236,14 @@ class RunStore:
         Returns:
             True if run was updated, False if not found
         """
-        async with self._lock:
-            if run_id not in self._runs:
-                return False
-            
-            self._runs[run_id].update(updates)
-            return True
+        run = self._runs.get(run_id)
+        if run is None:
+            return False
+        
+        run.update(updates)
+        if 'completed_at' in updates and 'completed_at_ts' not in updates:
+            run['completed_at_ts'] = _completed_at_ts(updates['completed_at'])
+        return True
     
     async def update_run_status(self, run_id: str, status: RunStatus, 
                               error_message: Optional[str] = None) -> bool:
@@ -161,15 +257,20 @@ class RunStore:
         Returns:
             True if run was updated, False if not found
         """
-        updates = {'status': status.value}
+        run = self._runs.get(run_id)
+        if run is None:
+            return False
         
+        run['status'] = status.value
         if error_message:
-            updates['error_message'] = error_message
+            run['error_message'] = error_message
         
-        if status in [RunStatus.COMPLETED, RunStatus.ERROR, RunStatus.TIMEOUT]:
-            updates['completed_at'] = datetime.now().isoformat()
+        if status.value in _TERMINAL_STATUSES:
+            completed_at_ts = time.time()
+            run['completed_at'] = _iso_now(completed_at_ts)
+            run['completed_at_ts'] = completed_at_ts
         
-        return await self.update_run(run_id, updates)
+        return True
     
     async def update_run_state(self, run_id: str, state: ExecutionState) -> bool:
         """Update run execution state.
@@ -181,29 +282,30 @@ class RunStore:
         Returns:
             True if run was updated, False if not found
         """
-        updates = {
-            'current_state': state.dict(),
-            'iteration_count': state.iteration_count
-        }
+        run = self._runs.get(run_id)
+        if run is None:
+            return False
         
-        return await self.update_run(run_id, updates)
+        # Assign in place rather than building and merging an updates dict
+        run['current_state'] = state
+        run['iteration_count'] = state.iteration_count
+        return True
     
-    async def add_run_log(self, run_id: str, log_entry: Dict[str, Any]) -> bool:
+    async def add_run_log(self, run_id: str, log_entry: LogEntryDict) -> bool:
         """Add a log entry to a run.
         
         Args:
             run_id: Run identifier
-            log_entry: Log entry data
+            log_entry: Plain log entry dictionary; it is stored without validation
             
         Returns:
             True if log was added, False if run not found
         """
-        async with self._lock:
-            if run_id not in self._runs:
-                return False
-            
-            self._runs[run_id]['logs'].append(log_entry)
-            return True
+        if run_id not in self._runs:
+            return False
+        
+        self._runs[run_id]['logs'].append(log_entry)
+        return True
     
     async def set_current_node(self, run_id: str, node_id: Optional[str]) -> bool:
         """Set the currently executing node for a run.
@@ -226,13 +328,10 @@ class RunStore:
         Returns:
             List of run data
         """
-        async with self._lock:
-            runs = list(self._runs.values())
-            
-            if graph_id:
-                runs = [run for run in runs if run['graph_id'] == graph_id]
-            
-            return runs
+        if graph_id:
+            return [self._runs[run_id] for run_id in self._by_graph.get(graph_id, ())]
+        
+        return list(self._runs.values())
     
     async def delete_run(self, run_id: str) -> bool:
         """Delete a run.
@@ -243,8 +342,7 @@ class RunStore:
         Returns:
             True if run was deleted, False if not found
         """
-        async with self._lock:
-            return self._runs.pop(run_id, None) is not None
+        return self._remove_run(run_id)
     
     async def run_exists(self, run_id: str) -> bool:
         """Check if run exists.
@@ -255,8 +353,7 @@ class RunStore:
         Returns:
             True if run exists
         """
-        async with self._lock:
-            return run_id in self._runs
+        return run_id in self._runs
     
     async def cleanup_completed_runs(self, max_age_hours: int = 24) -> int:
         """Clean up old completed runs.
@@ -267,24 +364,20 @@ class RunStore:
         Returns:
             Number of runs cleaned up
         """
-        from datetime import timedelta
-        
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        cutoff_ts = time.time() - max_age_hours * 3600
         cleaned_count = 0
         
-        async with self._lock:
-            runs_to_delete = []
-            
-            for run_id, run_data in self._runs.items():
-                if run_data['status'] in [RunStatus.COMPLETED.value, RunStatus.ERROR.value, RunStatus.TIMEOUT.value]:
-                    if run_data['completed_at']:
-                        completed_at = datetime.fromisoformat(run_data['completed_at'])
-                        if completed_at < cutoff_time:
-                            runs_to_delete.append(run_id)
-            
-            for run_id in runs_to_delete:
-                del self._runs[run_id]
-                cleaned_count += 1
+        runs_to_delete = []
+        
+        for run_id, run_data in self._runs.items():
+            if run_data['status'] in _TERMINAL_STATUSES:
+                completed_at_ts = run_data['completed_at_ts']
+                if completed_at_ts is not None and completed_at_ts < cutoff_ts:
+                    runs_to_delete.append(run_id)
+        
+        for run_id in runs_to_delete:
+            self._remove_run(run_id)
+            cleaned_count += 1
         
         return cleaned_count
 
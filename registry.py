@@ -1,6 +1,7 @@
 """Node registry and base classes for workflow execution."""
 
 import asyncio
+import math
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
@@ -8,7 +9,7 @@ if TYPE_CHECKING:
     from app.engine import ExecutionContext
 from uuid import uuid4
 
-from app.models import NodeDefinition, EdgeDefinition
+from app.models import NodeDefinition, NodeType, EdgeDefinition
 
 
 class NodeResult:
@@ -25,11 +26,15 @@ class NodeResult:
 class Node(ABC):
     """Base class for workflow nodes."""
     
+    # Pure nodes depend only on execution state, so the engine may memoize them
+    pure: bool = False
+    
     def __init__(self, node_id: str, config: Optional[Dict[str, Any]] = None):
         """Initialize node."""
         self.node_id = node_id
         self.config = config or {}
         self.timeout = self.config.get('timeout', 30.0)
+        self.pure = self.config.get('pure', self.pure)
     
     @abstractmethod
     async def execute(self, context: 'ExecutionContext') -> NodeResult:
@@ -37,16 +42,22 @@ class Node(ABC):
         pass
     
     async def execute_with_timeout(self, context: 'ExecutionContext') -> NodeResult:
-        """Execute node with timeout protection."""
+        """Execute node with timeout protection.
+        
+        Nodes configured without a deadline (timeout of None or infinity) are
+        awaited directly, skipping the timer that wait_for would schedule.
+        """
         try:
+            if self.timeout is None or self.timeout == math.inf:
+                return await self.execute(context)
             return await asyncio.wait_for(self.execute(context), timeout=self.timeout)
         except asyncio.TimeoutError:
             error_msg = f"Node {self.node_id} timed out after {self.timeout} seconds"
-            await context.log(self.node_id, error_msg, "ERROR")
+            context.log(self.node_id, error_msg, "ERROR")
             return NodeResult(success=False, error_message=error_msg)
         except Exception as e:
             error_msg = f"Node {self.node_id} failed with exception: {str(e)}"
-            await context.log(self.node_id, error_msg, "ERROR", {"exception": str(e)})
+            context.log(self.node_id, error_msg, "ERROR", {"exception": str(e)})
             return NodeResult(success=False, error_message=error_msg)
 
 
@@ -55,19 +66,23 @@ class NodeRegistry:
     
     def __init__(self):
         """Initialize node registry."""
-        self._node_types: Dict[str, type] = {}
+        self._node_types: Dict[NodeType, type] = {}
         self._nodes: Dict[str, Node] = {}
     
     def register_node_type(self, node_type: str, node_class: type):
-        """Register a node type."""
-        self._node_types[node_type] = node_class
+        """Register a node type.
+        
+        Raises:
+            ValueError: If node_type is not a NodeType value
+        """
+        self._node_types[NodeType(node_type)] = node_class
     
     def create_node(self, definition: NodeDefinition) -> Node:
         """Create a node from definition."""
-        if definition.type not in self._node_types:
+        node_class = self._node_types.get(definition.type)
+        if node_class is None:
             raise ValueError(f"Unknown node type: {definition.type}")
         
-        node_class = self._node_types[definition.type]
         node = node_class(definition.id, definition.config)
         self._nodes[definition.id] = node
         return node
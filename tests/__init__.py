@@ -23,6 +23,8 @@ Usage:
     pytest tests/test_tools.py  # Specific test file
 """
 
+import copy
+
 __version__ = "1.0.0"
 __author__ = "Code Review Mini-Agent Team"
 
@@ -50,27 +52,33 @@ SAMPLE_COMPLEX_CODE = """def complex_function(data):
     return result"""
 
 # Test utilities
+_TEST_GRAPH_DEFINITION = {
+    "nodes": {
+        "extract": {"id": "extract", "type": "extract", "config": {}},
+        "complexity": {"id": "complexity", "type": "complexity", "config": {}},
+        "issues": {"id": "issues", "type": "issues", "config": {}},
+        "suggest": {"id": "suggest", "type": "suggest", "config": {}}
+    },
+    "edges": [
+        {"from_node": "extract", "to_node": "complexity"},
+        {"from_node": "complexity", "to_node": "issues"},
+        {"from_node": "issues", "to_node": "suggest"}
+    ],
+    "start_node": "extract"
+}
+
+_TEST_EXECUTION_STATE = {
+    "quality_threshold": DEFAULT_QUALITY_THRESHOLD,
+    "max_iterations": MAX_TEST_ITERATIONS
+}
+
 def get_test_graph_definition():
-    """Get a standard test graph definition."""
-    return {
-        "nodes": {
-            "extract": {"id": "extract", "type": "extract", "config": {}},
-            "complexity": {"id": "complexity", "type": "complexity", "config": {}},
-            "issues": {"id": "issues", "type": "issues", "config": {}},
-            "suggest": {"id": "suggest", "type": "suggest", "config": {}}
-        },
-        "edges": [
-            {"from_node": "extract", "to_node": "complexity"},
-            {"from_node": "complexity", "to_node": "issues"},
-            {"from_node": "issues", "to_node": "suggest"}
-        ],
-        "start_node": "extract"
-    }
+    """Get a standard test graph definition.
+    
+    Returns a deep copy of the shared definition so callers may mutate it.
+    """
+    return copy.deepcopy(_TEST_GRAPH_DEFINITION)
 
 def get_test_execution_state(source_code=None):
     """Get a standard test execution state."""
-    return {
-        "source_code": source_code or SAMPLE_SIMPLE_CODE,
-        "quality_threshold": DEFAULT_QUALITY_THRESHOLD,
-        "max_iterations": MAX_TEST_ITERATIONS
-    }
\ No newline at end of file
+    return {"source_code": source_code or SAMPLE_SIMPLE_CODE, **_TEST_EXECUTION_STATE}
\ No newline at end of file
@@ -13,16 +13,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi.testclient import TestClient
 from app.main import app
+from tests import get_test_graph_definition, get_test_execution_state
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client shared by every test in this module.
+    
+    Entering the client runs the application lifespan once for the module.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 class TestAPIEndpoints:
     """Test suite for API endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_root_endpoint(self, client):
         """Test root endpoint returns API information."""
         response = client.get("/")
@@ -77,8 +83,6 @@ class TestAPIEndpoints:
     
     def test_create_graph_endpoint(self, client):
         """Test graph creation endpoint."""
-        from tests import get_test_graph_definition
-        
         graph_definition = {
             "definition": get_test_graph_definition()
         }
@@ -114,6 +118,16 @@ class TestAPIEndpoints:
         data = response.json()
         assert "error" in data
     
+    def test_create_graph_rejects_non_dict_config(self, client):
+        """Test that node configs must be objects even though their values are not validated."""
+        for config in ("abc", [1], None):
+            graph_definition = get_test_graph_definition()
+            graph_definition["nodes"]["extract"]["config"] = config
+            
+            response = client.post("/graph/create", json={"definition": graph_definition})
+            
+            assert response.status_code == 422
+    
     def test_run_graph_nonexistent(self, client):
         """Test running a non-existent graph."""
         run_request = {
@@ -145,15 +159,8 @@ class TestAPIEndpoints:
 class TestIntegrationWorkflow:
     """Integration tests for complete workflow."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_complete_workflow_integration(self, client):
         """Test complete workflow from graph creation to execution."""
-        from tests import get_test_graph_definition, get_test_execution_state
-        
         # Step 1: Create a graph
         graph_definition = {
             "definition": get_test_graph_definition()
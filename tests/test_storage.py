@@ -0,0 +1,191 @@
+"""
+Tests for the in-memory graph and run stores.
+
+These tests verify how graphs and runs are recorded and updated.
+"""
+
+import pytest
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add project root to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import ExecutionState, GraphDefinition, RunStatus
+from app.storage import GraphStore, RunStore, _iso_now
+
+
+@pytest.fixture
+def definition():
+    """Create a minimal graph definition."""
+    return GraphDefinition(
+        nodes={"extract": {"id": "extract", "type": "extract"}},
+        edges=[],
+        start_node="extract"
+    )
+
+
+class TestGraphStore:
+    """Test suite for graph storage."""
+
+    @pytest.mark.asyncio
+    async def test_stores_definition_instance(self, definition):
+        """Test that the definition model is stored without being dumped."""
+        store = GraphStore()
+
+        graph_id = await store.create_graph(definition)
+        graph = await store.get_graph(graph_id)
+
+        assert graph["definition"] is definition
+        assert await store.graph_exists(graph_id)
+
+    @pytest.mark.asyncio
+    async def test_builds_adjacency_index(self):
+        """Test that outgoing edges are indexed by source node."""
+        store = GraphStore()
+        definition = GraphDefinition(
+            nodes={
+                node_id: {"id": node_id, "type": node_id}
+                for node_id in ("extract", "complexity", "issues")
+            },
+            edges=[
+                {"from_node": "extract", "to_node": "complexity"},
+                {"from_node": "extract", "to_node": "issues", "condition": "state.lines_of_code > 0"},
+            ],
+            start_node="extract"
+        )
+
+        graph = await store.get_graph(await store.create_graph(definition))
+
+        assert graph["adjacency"] == {
+            "extract": [("complexity", None), ("issues", "state.lines_of_code > 0")]
+        }
+
+
+class TestRunStore:
+    """Test suite for run storage."""
+
+    @pytest.mark.asyncio
+    async def test_run_state_is_stored_live(self):
+        """Test that run states are kept as model instances."""
+        store = RunStore()
+        initial_state = ExecutionState(source_code="x = 1")
+
+        run_id = await store.create_run("graph-1", initial_state)
+        snapshot = (await store.get_run(run_id))["current_state"]
+        assert snapshot is not initial_state
+        assert snapshot == initial_state
+
+        new_state = ExecutionState(source_code="x = 1", iteration_count=2)
+        assert await store.update_run_state(run_id, new_state)
+
+        run = await store.get_run(run_id)
+        assert run["initial_state"] is initial_state
+        assert run["current_state"] is new_state
+        assert run["iteration_count"] == 2
+        assert not await store.update_run_state("missing", new_state)
+
+    @pytest.mark.asyncio
+    async def test_logs_are_stored_as_plain_dicts(self):
+        """Test that run logs are appended without model validation."""
+        store = RunStore()
+        run_id = await store.create_run("graph-1", ExecutionState())
+        entry = {"timestamp": "2024-01-01T00:00:00", "node_id": "extract", "level": "INFO", "message": "Parsed"}
+
+        assert await store.add_run_log(run_id, entry)
+        assert not await store.add_run_log("missing", entry)
+
+        run = await store.get_run(run_id)
+        assert list(run["logs"]) == [entry]
+
+    @pytest.mark.asyncio
+    async def test_logs_are_bounded(self):
+        """Test that only the most recent log entries are kept per run."""
+        store = RunStore(max_logs=2)
+        run_id = await store.create_run("graph-1", ExecutionState())
+
+        for i in range(3):
+            await store.add_run_log(run_id, {"node_id": "extract", "message": f"message {i}"})
+
+        run = await store.get_run(run_id)
+        assert [entry["message"] for entry in run["logs"]] == ["message 1", "message 2"]
+
+    @pytest.mark.asyncio
+    async def test_list_runs_by_graph_uses_index(self):
+        """Test that filtered listings track run creation order and deletion."""
+        store = RunStore()
+        first = await store.create_run("graph-1", ExecutionState())
+        second = await store.create_run("graph-1", ExecutionState())
+        other = await store.create_run("graph-2", ExecutionState())
+        third = await store.create_run("graph-1", ExecutionState())
+
+        assert [run["run_id"] for run in await store.list_runs("graph-1")] == [first, second, third]
+        assert len(await store.list_runs()) == 4
+
+        assert await store.delete_run(first)
+        assert await store.delete_run(other)
+        assert not await store.delete_run(other)
+
+        assert [run["run_id"] for run in await store.list_runs("graph-1")] == [second, third]
+        assert await store.list_runs("graph-2") == []
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_only_old_finished_runs(self):
+        """Test that cleanup compares completion timestamps against the cutoff."""
+        store = RunStore()
+        old_run = await store.create_run("graph-1", ExecutionState())
+        recent_run = await store.create_run("graph-1", ExecutionState())
+        pending_run = await store.create_run("graph-1", ExecutionState())
+
+        await store.update_run_status(old_run, RunStatus.COMPLETED)
+        await store.update_run_status(recent_run, RunStatus.ERROR, "boom")
+        assert not await store.update_run_status("missing", RunStatus.COMPLETED)
+        assert (await store.get_run(recent_run))["error_message"] == "boom"
+        await store.update_run(old_run, {"completed_at_ts": time.time() - 2 * 3600})
+
+        assert await store.cleanup_completed_runs(max_age_hours=1) == 1
+        assert not await store.run_exists(old_run)
+        assert await store.run_exists(recent_run)
+        assert await store.run_exists(pending_run)
+        assert len(await store.list_runs("graph-1")) == 2
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_runs_finished_through_update_run(self):
+        """Test that runs completed via update_run get a completion timestamp."""
+        store = RunStore()
+        old_run = await store.create_run("graph-1", ExecutionState())
+        recent_run = await store.create_run("graph-1", ExecutionState())
+
+        await store.update_run(old_run, {
+            "status": RunStatus.COMPLETED.value,
+            "completed_at": datetime.fromtimestamp(time.time() - 2 * 3600).isoformat()
+        })
+        await store.update_run(recent_run, {"status": RunStatus.ERROR, "completed_at": datetime.now()})
+
+        assert await store.cleanup_completed_runs(max_age_hours=1) == 1
+        assert not await store.run_exists(old_run)
+        assert await store.run_exists(recent_run)
+
+
+class TestIsoNow:
+    """Test suite for cached timestamp formatting."""
+
+    def test_reuses_string_within_a_millisecond(self):
+        """Test that nearby timestamps share one formatted string."""
+        now = 1_600_000_000.0
+        first = _iso_now(now)
+
+        assert _iso_now(now + 0.0005) == first
+        assert _iso_now(now + 1.0) != first
+
+    def test_formats_as_iso(self):
+        """Test that the result is a parseable ISO timestamp."""
+        now = 1_700_000_000.25
+
+        assert datetime.fromisoformat(_iso_now(now)) == datetime.fromtimestamp(now)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
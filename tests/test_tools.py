@@ -8,18 +8,44 @@ import pytest
 import ast
 import sys
 import os
+from unittest.mock import patch
 
 # Add project root to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.models import IssueSeverity, IssueType
+import tools
 from tools import (
+    analyze_many,
     parse_python_code,
+    parse_python_quick,
+    parse_python_full,
+    parse_python_tree,
     count_lines_of_code,
+    count_functions,
+    count_classes,
+    count_nested_blocks,
+    count_long_names,
+    find_long_names,
+    calculate_cyclomatic_complexity,
     calculate_complexity_score,
+    calculate_complexity_scores_batch,
     calculate_quality_score,
+    calculate_quality_scores_batch,
+    calculate_scores,
+    detect_todo_comments,
+    scan_lines,
+    detect_print_statements,
+    detect_bare_exceptions,
+    CodeSmell,
     detect_code_smells,
+    detect_code_smell_batch,
     get_quality_rating,
-    generate_improvement_suggestions
+    get_quality_ratings_batch,
+    score_many,
+    generate_improvement_suggestions,
+    generate_suggestions_for_types,
+    _suggestions_for
 )
 
 
@@ -46,6 +72,19 @@ def hello():
         result = count_lines_of_code(code)
         assert result == 3  # Comments should be ignored
     
+    def test_count_lines_of_code_ascii_and_unicode_agree(self):
+        """Test that the ASCII bytes scan and the Unicode scan follow the same rules."""
+        code = "x = 1\n\x1c\n\t# comment\n\f\ny = 2\n"
+        
+        assert count_lines_of_code(code) == 2
+        assert count_lines_of_code(code + "s = '\u00e9'\n\u00a0\n") == 3
+    
+    def test_count_lines_of_code_line_endings(self):
+        """Test that a missing final newline and CRLF endings do not change the count."""
+        assert count_lines_of_code("x = 1\ny = 2") == 2
+        assert count_lines_of_code("x = 1\r\n\r\n  # note\r\ny = 2\r\n") == 2
+        assert count_lines_of_code("") == 0
+    
     def test_parse_python_code_comprehensive(self):
         """Test comprehensive code parsing."""
         code = """def calculate_sum(numbers):
@@ -72,6 +111,162 @@ def hello():
         assert len(result['todo_comments']) == 1
         assert len(result['print_statements']) == 1
     
+    def test_parse_python_code_reuses_cached_metrics(self):
+        """Test that identical sources are analyzed once and results stay isolated."""
+        code = "def cached_example():\n    print('hi')  # TODO: log\n"
+        
+        first = parse_python_code(code)
+        first['print_statements'].clear()
+        first['todo_comments'][0]['content'] = "mutated"
+        
+        with patch("tools._analyze_source") as analyze:
+            second = parse_python_code(code)
+        
+        analyze.assert_not_called()
+        assert len(second['print_statements']) == 1
+        assert second['todo_comments'][0]['content'] != "mutated"
+    
+    def test_analyze_many_preserves_order(self):
+        """Test batch analysis for both serial and multi-process batch sizes."""
+        sources = [f"def f{i}():\n" + "    x = 1\n" * i + "    return x\n" for i in range(1, 6)]
+        
+        small = analyze_many(sources[:2])
+        large = analyze_many(sources)
+        
+        assert [m['lines_of_code'] for m in small] == [3, 4]
+        assert [m['lines_of_code'] for m in large] == [3, 4, 5, 6, 7]
+        assert large == [parse_python_code(source) for source in sources]
+    
+    def test_parse_python_code_single_pass_metrics(self):
+        """Test that fused traversal metrics follow the standalone tool rules."""
+        code = """class VeryLongClassNameForTestingPurposes:
+    def method(self, values):
+        result = [v for v in values if v and v > 0]
+        with open("x") as handle:
+            for item in values:
+                if item:
+                    print(item)
+                elif item is None:
+                    pass
+                else:
+                    pass
+        try:
+            pass
+        except ValueError:
+            pass
+        except:
+            pass
+        return result"""
+        
+        result = parse_python_code(code)
+        tree = ast.parse(code)
+        
+        assert result['functions_found'] == count_functions(tree) == 1
+        assert result['classes_found'] == 1
+        assert result['nested_blocks'] == 6
+        # 1 base + list comp (2) + and (1) + for (1) + if/else (2) + elif (1) + 2 handlers
+        assert result['cyclomatic_complexity'] == calculate_cyclomatic_complexity(tree) == 10
+        assert result['long_names'] == ['VeryLongClassNameForTestingPurposes']
+        assert [p['line_number'] for p in result['print_statements']] == [7]
+        assert [b['line_number'] for b in result['bare_exceptions']] == [16]
+    
+    def test_scan_lines_finds_long_lines_and_todos(self):
+        """Test that one line scan reports both long lines and TODO comments."""
+        code = "x = 1\n" + "# TODO " + "a" * 100 + "\n" + "y = 2\n"
+        
+        long_lines, todos = scan_lines(code)
+        
+        assert long_lines == [{'line_number': 2, 'length': 107}]
+        assert [todo['line_number'] for todo in todos] == [2]
+        assert parse_python_code(code)['long_lines'] == long_lines
+    
+    def test_todo_markers_match_whole_words(self):
+        """Test that TODO-style markers are matched as words in comments only."""
+        code = "x = 1  # todo: rename\n# FIXME\n# debug output\n# see footnote\ny = 'TODO'\n# a # HACK\n"
+        
+        todos = detect_todo_comments(code)
+        
+        assert [todo['line_number'] for todo in todos] == [1, 2, 6]
+        assert todos[0]['content'] == "x = 1  # todo: rename"
+    
+    def test_standalone_tools_see_tree_changes(self):
+        """Test that the standalone detectors analyze the tree as it is when called."""
+        tree = ast.parse("print(1)\nprint(2)\ntry:\n    pass\nexcept:\n    pass\n")
+        
+        prints = detect_print_statements(tree)
+        assert len(prints) == 2
+        assert [b['line_number'] for b in detect_bare_exceptions(tree)] == [5]
+        
+        prints.clear()
+        assert len(detect_print_statements(tree)) == 2
+        
+        tree.body.pop()
+        tree.body.pop(0)
+        assert [p['line_number'] for p in detect_print_statements(tree)] == [2]
+        assert detect_bare_exceptions(tree) == []
+    
+    def test_statement_only_walks_find_nested_definitions(self):
+        """Test that pruning expressions still reaches every definition and block."""
+        code = """class Outer:
+    def method(self):
+        try:
+            with open("x") as f:
+                def inner():
+                    return lambda: [i for i in range(3)]
+        except Exception:
+            class Local:
+                pass
+"""
+        tree = ast.parse(code)
+        
+        assert count_functions(tree) == 2
+        assert count_classes(tree) == 2
+        assert count_nested_blocks(tree) == 5
+    
+    def test_quick_and_full_tiers(self):
+        """Test that the tiers split the metrics and only the full tier parses."""
+        code = "def f():\n    # TODO: finish\n    print(1)\n"
+        
+        with patch("tools.ast.parse") as parse:
+            quick = parse_python_quick(code)
+        parse.assert_not_called()
+        
+        full = parse_python_full(code)
+        
+        assert quick == {'lines_of_code': 2, 'todo_comments': detect_todo_comments(code), 'long_lines': []}
+        assert full['functions_found'] == 1
+        assert {**quick, **full} == parse_python_code(code)
+    
+    def test_parse_python_tree_returns_reusable_tree(self):
+        """Test that the parsed tree is returned alongside the full metrics."""
+        code = "class A:\n    def f(self):\n        return 1\n"
+        
+        tree, metrics = parse_python_tree(code)
+        
+        assert isinstance(tree, ast.Module)
+        assert metrics == parse_python_code(code)
+        assert count_functions(tree) == metrics['functions_found'] == 1
+        
+        # The tree is analyzed once during extraction and not cached afterwards
+        with patch("tools._analyze_tree", wraps=tools._analyze_tree) as analyze:
+            parse_python_tree(code)
+            assert detect_print_statements(tree) == metrics['print_statements'] == []
+        assert analyze.call_count == 2
+    
+    def test_count_long_names_matches_find_long_names(self):
+        """Test that the long-name count agrees with the deduplicated list."""
+        code = """def a_function_with_a_long_name(): pass
+a_function_with_a_long_name()
+another_variable_with_long_name = 1
+short = another_variable_with_long_name
+"""
+        tree = ast.parse(code)
+        
+        assert count_long_names(tree) == len(find_long_names(tree)) == 2
+        assert find_long_names(tree) == ['a_function_with_a_long_name', 'another_variable_with_long_name']
+        assert count_long_names(tree, threshold=30) == 1
+        assert parse_python_code(code)['long_names_count'] == 2
+    
     def test_complexity_score_calculation(self):
         """Test complexity score formula."""
         # Test with known values
@@ -98,6 +293,53 @@ def hello():
         assert result == expected
         assert result >= 0  # Score should not go below 0
     
+    def test_batch_scores_match_scalar_formulas(self):
+        """Test that batch scoring agrees with the per-file formulas."""
+        locs, nested, long_counts = [10, 0, 1000], [2, 0, 100], [1, 0, 50]
+        
+        complexity = calculate_complexity_scores_batch(locs, nested, long_counts)
+        quality = calculate_quality_scores_batch(complexity, [3, 0, 2])
+        
+        assert complexity == [
+            calculate_complexity_score(loc, blocks, ["name"] * count)
+            for loc, blocks, count in zip(locs, nested, long_counts)
+        ]
+        assert quality == [
+            calculate_quality_score(score, issues)
+            for score, issues in zip(complexity, [3, 0, 2])
+        ]
+    
+    def test_combined_scores_match_scalar_formulas(self):
+        """Test that calculate_scores matches the two scalar scoring functions."""
+        for loc, nested, long_names, issues in [(10, 1, 0, 0), (30, 3, 2, 4), (200, 9, 5, 1), (0, 0, 0, 12)]:
+            complexity = calculate_complexity_score(loc, nested, ["name"] * long_names)
+            
+            assert calculate_scores(loc, nested, long_names, issues) == (
+                complexity, calculate_quality_score(complexity, issues)
+            )
+    
+    def test_batch_ratings_and_scores_match_scalar_functions(self):
+        """Test that batch ratings and score_many agree with the per-file tools."""
+        scores = [0.0, 19.9, 20.0, 45.0, 60.0, 79.99, 80.0, 100.0]
+        assert get_quality_ratings_batch(scores) == [get_quality_rating(score) for score in scores]
+        
+        sources = ["x = 1\n", "def f():\n    # TODO: fix\n    print(1)\n"]
+        results = score_many(sources)
+        
+        for source, result in zip(sources, results):
+            metrics = parse_python_code(source)
+            issues = detect_code_smells(source, metrics)
+            complexity = calculate_complexity_score(
+                metrics['lines_of_code'], metrics['nested_blocks'], metrics['long_names']
+            )
+            quality = calculate_quality_score(complexity, len(issues))
+            assert result == {
+                'complexity_score': complexity,
+                'quality_score': quality,
+                'rating': get_quality_rating(quality)[0],
+                'num_issues': len(issues),
+            }
+    
     def test_quality_rating_categories(self):
         """Test quality rating categorization."""
         test_cases = [
@@ -114,6 +356,22 @@ def hello():
             assert isinstance(description, str)
             assert len(description) > 0
     
+    def test_quality_rating_band_edges(self):
+        """Test band boundaries and scores outside 0-100, including non-finite ones."""
+        test_cases = [
+            (-5.0, "Very Poor"),
+            (19.999, "Very Poor"),
+            (20.0, "Poor"),
+            (79.999, "Good"),
+            (80.0, "Excellent"),
+            (150.0, "Excellent"),
+            (float('-inf'), "Very Poor"),
+            (float('inf'), "Excellent"),
+        ]
+        
+        for score, expected_rating in test_cases:
+            assert get_quality_rating(score)[0] == expected_rating
+    
     def test_detect_code_smells_comprehensive(self):
         """Test comprehensive code smell detection."""
         code = """def problematic_function():
@@ -147,6 +405,57 @@ def hello():
             assert 'description' in issue
             assert 'suggestion' in issue
     
+    def test_long_lines_ignore_crlf_endings(self):
+        """Test that CRLF line endings do not count towards line length."""
+        code = "x = 1\r\n" + "y = '" + "a" * 94 + "'\r\n" + "z = '" + "a" * 95 + "'\r\n"
+        
+        long_lines = [issue for issue in detect_code_smells(code, {}) if issue.type == 'style']
+        
+        assert [issue.line_number for issue in long_lines] == [3]
+        assert long_lines[0].description == "Line too long (101 characters)"
+    
+    def test_long_line_reports_are_capped(self):
+        """Test that long lines past the report limit fold into one summary issue."""
+        code = ("x = '" + "a" * 100 + "'\n") * (tools.MAX_LONG_LINE_REPORTS + 7)
+        
+        long_lines = [issue for issue in detect_code_smells(code, {}) if issue.type == 'style']
+        
+        assert len(long_lines) == tools.MAX_LONG_LINE_REPORTS + 1
+        assert long_lines[-1].description == "7 more lines too long"
+        assert long_lines[-1].line_number == tools.MAX_LONG_LINE_REPORTS + 1
+    
+    def test_issue_batch_columns_match_records(self):
+        """Test that the columnar batch holds the same issues as the record list."""
+        code = "def f():\n    print(1)\n    # TODO: later\n"
+        metrics = parse_python_code(code)
+        
+        batch = detect_code_smell_batch(code, metrics)
+        records = detect_code_smells(code, metrics)
+        
+        assert len(batch) == len(records) == 2
+        assert batch.types == [record.type for record in records]
+        assert batch.line_numbers == [None, None]
+        assert [smell.to_dict() for smell in batch] == [record.to_dict() for record in records]
+        # Members are stored directly, so consumers need no enum lookups
+        assert all(type(issue_type) is IssueType for issue_type in batch.types)
+        assert all(type(severity) is IssueSeverity for severity in batch.severities)
+    
+    def test_code_smell_record_access(self):
+        """Test that slot-based issues also support read-only dict access."""
+        smell = CodeSmell('style', 'low', "Line too long", "Break it", line_number=3)
+        
+        assert smell.type == smell['type'] == 'style'
+        assert 'line_number' in smell and 'extra' not in smell
+        assert smell.get('extra', 'default') == 'default'
+        assert smell.to_dict() == {
+            'type': 'style', 'severity': 'low', 'line_number': 3,
+            'description': "Line too long", 'suggestion': "Break it"
+        }
+        with pytest.raises(KeyError):
+            smell['extra']
+        with pytest.raises(AttributeError):
+            smell.extra = 1
+    
     def test_generate_improvement_suggestions(self):
         """Test suggestion generation logic."""
         complexity_score = 60.0
@@ -176,6 +485,28 @@ def hello():
         
         # Verify no duplicates
         assert len(suggestions) == len(set(suggestions))
+    
+    def test_suggestions_from_issue_types_match_issue_dicts(self):
+        """Test that suggestions built from issue types equal those built from issue dicts."""
+        issues = [{'type': 'style', 'severity': 'low'}, {'type': 'maintenance', 'severity': 'low'}]
+        metrics = {'lines_of_code': 60, 'functions_found': 3}
+        
+        assert generate_suggestions_for_types(35.0, ['style', 'maintenance'], metrics) == \
+            generate_improvement_suggestions(80.0, 35.0, issues, metrics)
+    
+    def test_generate_improvement_suggestions_memoized(self):
+        """Test that repeated inputs reuse results without sharing the list."""
+        issues = [{'type': 'naming', 'severity': 'low'}]
+        metrics = {'lines_of_code': 10, 'functions_found': 0}
+        
+        first = generate_improvement_suggestions(50.0, 70.0, issues, metrics)
+        first.append("mutated")
+        hits = _suggestions_for.cache_info().hits
+        second = generate_improvement_suggestions(55.0, 75.0, issues, metrics)
+        
+        assert _suggestions_for.cache_info().hits == hits + 1
+        assert "mutated" not in second
+        assert "Use more concise and descriptive variable names" in second
 
 
 class TestEdgeCases:
@@ -193,6 +524,27 @@ class TestEdgeCases:
         assert result1['lines_of_code'] == 0
         assert result2['lines_of_code'] == 0
     
+    def test_blank_code_skips_parsing(self):
+        """Test that blank input returns base metrics without parsing."""
+        with patch("tools._analyze_source") as analyze:
+            result = parse_python_code(" \t\n\n")
+        
+        analyze.assert_not_called()
+        assert result['cyclomatic_complexity'] == 1
+        assert result['functions_found'] == 0
+        assert result['long_names'] == []
+    
+    def test_deeply_nested_tree_does_not_recurse(self):
+        """Test that metrics are computed for trees deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        body = [ast.Pass()]
+        for _ in range(depth):
+            body = [ast.If(test=ast.Name(id='x', ctx=ast.Load()), body=body, orelse=[])]
+        tree = ast.Module(body=body, type_ignores=[])
+        
+        assert count_nested_blocks(tree) == depth - 1
+        assert calculate_cyclomatic_complexity(tree) == depth + 1
+    
     def test_invalid_syntax_handling(self):
         """Test handling of invalid Python syntax."""
         invalid_code = "def broken_function(\n    # Missing closing parenthesis"
@@ -7,7 +7,7 @@ These tests verify the workflow node execution and state management.
 import pytest
 import sys
 import os
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 # Add project root to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,14 +23,14 @@ class TestWorkflowNodes:
     @pytest.fixture
     def mock_context(self):
         """Create mock execution context."""
-        context = AsyncMock()
+        context = MagicMock()
         context.state = ExecutionState(
             source_code="def test_function():\n    return True",
             quality_threshold=80.0,
             max_iterations=10
         )
-        context.log = AsyncMock()
-        context.update_state = AsyncMock()
+        context.log = MagicMock()
+        context.update_state = MagicMock()
         return context
     
     @pytest.mark.asyncio
@@ -193,9 +193,9 @@ class TestNodeIntegration:
     async def test_complete_node_workflow(self, execution_state):
         """Test complete workflow through all nodes."""
         # Create mock context
-        context = AsyncMock()
+        context = MagicMock()
         context.state = execution_state
-        context.log = AsyncMock()
+        context.log = MagicMock()
         
         # Track state updates
         state_updates = {}
@@ -1,15 +1,12 @@
 """Code review workflow implementation with clean, modular nodes."""
 
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING
 
-from app.models import CodeIssue, IssueType, IssueSeverity
+from app.models import CodeIssue
 from registry import Node, NodeResult, node_registry
 
-# Import ExecutionContext from engine since we moved it there
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
-from app.engine import ExecutionContext
+if TYPE_CHECKING:
+    from app.engine import ExecutionContext
 
 # Import all tools from the tools module
 from tools import (
@@ -30,6 +27,7 @@ from tools import (
     detect_print_statements,
     detect_bare_exceptions,
     detect_code_smells,
+    detect_code_smell_batch,
     
     # Quality scoring tools
     calculate_quality_score,
@@ -37,17 +35,32 @@ from tools import (
     
     # Suggestion generation tools
     generate_improvement_suggestions,
+    generate_suggestions_for_types,
     
     # Utility functions
     format_analysis_summary
 )
 
 
-# Tool Registry - Dictionary of available tools that nodes can call
-tool_registry = {}
+# Tool Registry - Dictionary of available tools that nodes can call.
+# Tools map straight to the functions in tools.py, so a registry call costs
+# no extra wrapper frame.
+tool_registry = {
+    "parse_code": parse_python_code,
+    "count_lines": count_lines_of_code,
+    "calculate_complexity_score": calculate_complexity_score,
+    "calculate_quality_score": calculate_quality_score,
+    "detect_smells": detect_code_smells,
+    "generate_suggestions": generate_improvement_suggestions,
+}
 
-def register_tool(name: str, func):
-    """Register a tool function in the tool registry."""
+def register_tool(name: str, func=None):
+    """Register a tool function in the tool registry.
+    
+    Can be called directly or used as a decorator via ``@register_tool(name)``.
+    """
+    if func is None:
+        return lambda f: register_tool(name, f)
     tool_registry[name] = func
     return func
 
@@ -60,39 +73,6 @@ def list_tools():
     return list(tool_registry.keys())
 
 
-# Register all tools from tools.py
-@register_tool("parse_code")
-def _parse_code_tool(source_code: str) -> Dict[str, Any]:
-    """Tool wrapper for parse_python_code."""
-    return parse_python_code(source_code)
-
-@register_tool("count_lines")
-def _count_lines_tool(source_code: str) -> int:
-    """Tool wrapper for count_lines_of_code."""
-    return count_lines_of_code(source_code)
-
-@register_tool("calculate_complexity_score")
-def _complexity_score_tool(lines_of_code: int, nested_blocks: int, long_names: List[str]) -> float:
-    """Tool wrapper for calculate_complexity_score."""
-    return calculate_complexity_score(lines_of_code, nested_blocks, long_names)
-
-@register_tool("calculate_quality_score")
-def _quality_score_tool(complexity_score: float, num_issues: int) -> float:
-    """Tool wrapper for calculate_quality_score."""
-    return calculate_quality_score(complexity_score, num_issues)
-
-@register_tool("detect_smells")
-def _detect_smells_tool(source_code: str, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Tool wrapper for detect_code_smells."""
-    return detect_code_smells(source_code, metrics)
-
-@register_tool("generate_suggestions")
-def _generate_suggestions_tool(complexity_score: float, quality_score: float, 
-                              issues: List[Dict[str, Any]], metrics: Dict[str, Any]) -> List[str]:
-    """Tool wrapper for generate_improvement_suggestions."""
-    return generate_improvement_suggestions(complexity_score, quality_score, issues, metrics)
-
-
 # =============================================================================
 # CLEAN WORKFLOW NODES - Using tools for modularity
 # =============================================================================
@@ -100,21 +80,23 @@ def _generate_suggestions_tool(complexity_score: float, quality_score: float,
 class ExtractNode(Node):
     """Node that extracts comprehensive metrics from source code."""
     
-    async def execute(self, context: ExecutionContext) -> NodeResult:
+    pure = True
+    
+    async def execute(self, context: 'ExecutionContext') -> NodeResult:
         """Extract code metrics and store in state."""
         try:
             source_code = context.state.source_code
             if not source_code.strip():
-                await context.log(self.node_id, "No source code provided", "WARNING")
+                context.log(self.node_id, "No source code provided", "WARNING")
                 return NodeResult(success=True)
             
-            await context.log(self.node_id, "Parsing source code and extracting comprehensive metrics")
+            context.log(self.node_id, "Parsing source code and extracting comprehensive metrics")
             
             # Use tools to extract all metrics
             metrics = parse_python_code(source_code)
             
             # Update state with all extracted metrics
-            await context.update_state({
+            context.update_state({
                 'lines_of_code': metrics['lines_of_code'],
                 'nested_blocks': metrics['nested_blocks'],
                 'long_names': metrics['long_names'],
@@ -123,30 +105,32 @@ class ExtractNode(Node):
                 'cyclomatic_complexity': metrics['cyclomatic_complexity'],
                 'todo_comments': metrics['todo_comments'],
                 'print_statements': metrics['print_statements'],
-                'bare_exceptions': metrics['bare_exceptions']
+                'bare_exceptions': metrics['bare_exceptions'],
+                'long_lines': metrics['long_lines']
             })
             
-            await context.log(self.node_id, 
-                f"Extracted metrics: {metrics['lines_of_code']} LOC, "
-                f"{metrics['functions_found']} functions, "
-                f"{metrics['nested_blocks']} nested blocks, "
-                f"{len(metrics['long_names'])} long names")
+            context.log(self.node_id,
+                "Extracted metrics: %d LOC, %d functions, %d nested blocks, %d long names",
+                args=(metrics['lines_of_code'], metrics['functions_found'],
+                      metrics['nested_blocks'], len(metrics['long_names'])))
             
             return NodeResult(success=True)
             
         except Exception as e:
             error_msg = f"Failed to extract code metrics: {str(e)}"
-            await context.log(self.node_id, error_msg, "ERROR")
+            context.log(self.node_id, error_msg, "ERROR")
             return NodeResult(success=False, error_message=error_msg)
 
 
 class ComplexityNode(Node):
     """Node that calculates complexity scores using tools."""
     
-    async def execute(self, context: ExecutionContext) -> NodeResult:
+    pure = True
+    
+    async def execute(self, context: 'ExecutionContext') -> NodeResult:
         """Calculate complexity score and store in state."""
         try:
-            await context.log(self.node_id, "Calculating complexity score")
+            context.log(self.node_id, "Calculating complexity score")
             
             # Get metrics from state
             lines_of_code = context.state.lines_of_code
@@ -157,25 +141,27 @@ class ComplexityNode(Node):
             complexity_score = calculate_complexity_score(lines_of_code, nested_blocks, long_names)
             
             # Update state
-            await context.update_state({'complexity_score': complexity_score})
+            context.update_state({'complexity_score': complexity_score})
             
-            await context.log(self.node_id, f"Calculated complexity score: {complexity_score:.2f}")
+            context.log(self.node_id, "Calculated complexity score: %.2f", args=(complexity_score,))
             
             return NodeResult(success=True)
             
         except Exception as e:
             error_msg = f"Failed to calculate complexity score: {str(e)}"
-            await context.log(self.node_id, error_msg, "ERROR")
+            context.log(self.node_id, error_msg, "ERROR")
             return NodeResult(success=False, error_message=error_msg)
 
 
 class IssuesNode(Node):
     """Node that identifies code quality issues using comprehensive tools."""
     
-    async def execute(self, context: ExecutionContext) -> NodeResult:
+    pure = True
+    
+    async def execute(self, context: 'ExecutionContext') -> NodeResult:
         """Identify code issues and store in state."""
         try:
-            await context.log(self.node_id, "Analyzing code for quality issues")
+            context.log(self.node_id, "Analyzing code for quality issues")
             
             source_code = context.state.source_code
             
@@ -188,44 +174,49 @@ class IssuesNode(Node):
                 'functions_found': context.state.functions_found,
                 'todo_comments': context.state.todo_comments,
                 'print_statements': context.state.print_statements,
-                'bare_exceptions': context.state.bare_exceptions
+                'bare_exceptions': context.state.bare_exceptions,
+                'long_lines': context.state.long_lines
             }
             
             # Use tool to detect code smells and issues
-            raw_issues = detect_code_smells(source_code, metrics)
+            batch = detect_code_smell_batch(source_code, metrics)
             
-            # Convert to CodeIssue objects
-            issues = []
-            for issue_data in raw_issues:
-                issue = CodeIssue(
-                    type=IssueType(issue_data['type']),
-                    severity=IssueSeverity(issue_data['severity']),
-                    line_number=issue_data.get('line_number'),
-                    description=issue_data['description'],
-                    suggestion=issue_data['suggestion']
+            # Convert to CodeIssue objects straight from the issue columns
+            issues = [
+                CodeIssue(
+                    type=issue_type,
+                    severity=severity,
+                    line_number=line_number,
+                    description=description,
+                    suggestion=suggestion
                 )
-                issues.append(issue)
+                for issue_type, severity, line_number, description, suggestion in zip(
+                    batch.types, batch.severities, batch.line_numbers,
+                    batch.descriptions, batch.suggestions)
+            ]
             
             # Update state
-            await context.update_state({'issues': issues})
+            context.update_state({'issues': issues})
             
-            await context.log(self.node_id, f"Identified {len(issues)} code quality issues")
+            context.log(self.node_id, "Identified %d code quality issues", args=(len(issues),))
             
             return NodeResult(success=True)
             
         except Exception as e:
             error_msg = f"Failed to analyze code issues: {str(e)}"
-            await context.log(self.node_id, error_msg, "ERROR")
+            context.log(self.node_id, error_msg, "ERROR")
             return NodeResult(success=False, error_message=error_msg)
 
 
 class SuggestNode(Node):
     """Node that generates intelligent improvement suggestions using tools."""
     
-    async def execute(self, context: ExecutionContext) -> NodeResult:
+    pure = True
+    
+    async def execute(self, context: 'ExecutionContext') -> NodeResult:
         """Generate improvement suggestions and calculate quality score."""
         try:
-            await context.log(self.node_id, "Generating improvement suggestions")
+            context.log(self.node_id, "Generating improvement suggestions")
             
             # Get data from state
             complexity_score = context.state.complexity_score
@@ -240,18 +231,17 @@ class SuggestNode(Node):
                 'nested_blocks': context.state.nested_blocks,
                 'functions_found': context.state.functions_found,
                 'cyclomatic_complexity': context.state.cyclomatic_complexity,
-                'complexity_score': complexity_score,
-                'issues': [issue.dict() for issue in issues]
+                'complexity_score': complexity_score
             }
             
-            # Use tool to generate contextual suggestions
-            suggestions = generate_improvement_suggestions(
-                complexity_score, quality_score, 
-                [issue.dict() for issue in issues], metrics
+            # Use tool to generate contextual suggestions; only the issue types
+            # matter, so the models are not serialized to dictionaries
+            suggestions = generate_suggestions_for_types(
+                quality_score, (issue.type for issue in issues), metrics
             )
             
             # Update state
-            await context.update_state({
+            context.update_state({
                 'quality_score': quality_score,
                 'suggestions': suggestions
             })
@@ -259,15 +249,15 @@ class SuggestNode(Node):
             # Get quality rating for logging
             rating, description = get_quality_rating(quality_score)
             
-            await context.log(self.node_id, 
-                f"Generated {len(suggestions)} suggestions, "
-                f"quality score: {quality_score:.2f} ({rating})")
+            context.log(self.node_id,
+                "Generated %d suggestions, quality score: %.2f (%s)",
+                args=(len(suggestions), quality_score, rating))
             
             return NodeResult(success=True)
             
         except Exception as e:
             error_msg = f"Failed to generate suggestions: {str(e)}"
-            await context.log(self.node_id, error_msg, "ERROR")
+            context.log(self.node_id, error_msg, "ERROR")
             return NodeResult(success=False, error_message=error_msg)
 
 